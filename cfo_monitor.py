@@ -6,20 +6,56 @@ Generates detailed company and individual tear sheets as Word documents
 100% free and ToS compliant
 """
 
+import aiohttp
+import asyncio
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 import feedparser
 import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from email.mime.base import MIMEBase
-from email import encoders
+from email.message import EmailMessage
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from io import BytesIO
-import time
 import os
 import json
 import re
 
+# Resolve the optional python-docx dependency once at import instead of
+# re-running the import machinery on every tear sheet
+try:
+    from docx import Document
+    from docx.shared import Pt, Inches
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+    _DOCX = (Document, Pt, Inches, WD_ALIGN_PARAGRAPH)
+except ImportError:
+    _DOCX = None
+
+# Compiled once at import so the hot per-result paths skip re's cache lookup
+_CFO_RE = re.compile(r'cfo|chief financial officer|financial officer', re.IGNORECASE)
+
+# Common patterns for names in CFO announcements, combined into one
+# alternation so the text is scanned once instead of up to three times
+_NAME_RE = re.compile(
+    r'(?:appoints|names|hires|welcomes)\s+(?P<after_verb>[A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)'
+    r'|(?P<before_verb>[A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)\s+(?:as|named|appointed|joins)'
+    r'|CFO\s+(?P<after_title>[A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)'
+)
+
+_SANITIZE_RE = re.compile(r'[^\w\s-]')
+
+# Claude latency scales with generated tokens, so each sheet type gets its
+# own ceiling rather than a blanket 4000. CFO_MONITOR_FAST=1 drops the
+# individual sheets to Haiku with a tighter cap for quicker, cheaper runs.
+_COMPANY_MODEL = "claude-sonnet-4-20250514"
+_COMPANY_MAX_TOKENS = 3000
+_INDIVIDUAL_MODEL = "claude-sonnet-4-20250514"
+_INDIVIDUAL_MAX_TOKENS = 2000
+
+if os.environ.get('CFO_MONITOR_FAST') == '1':
+    _INDIVIDUAL_MODEL = "claude-3-5-haiku-20241022"
+    _INDIVIDUAL_MAX_TOKENS = 1500
+
 class CFOMonitor:
     def __init__(self, email_to, email_from, email_password, anthropic_api_key=None):
         self.email_to = email_to
@@ -28,15 +64,48 @@ class CFOMonitor:
         self.anthropic_api_key = anthropic_api_key
         self.results = []
         self.tear_sheets = []
-        
+        self._seen_urls = set()
+
+        # Timestamp the run once; the subject line, email body, prompts,
+        # and news-recency cutoff all reuse it
+        self._run_now = datetime.now()
+        self._run_date_str = self._run_now.strftime("%B %d, %Y")
+
+        # Tear sheet text keyed on normalized names, so duplicate findings
+        # (e.g. the same company in SEC and news) don't bill a second API call
+        self._company_cache = {}
+        self._individual_cache = {}
+
+        # One pooled session for the SEC side so repeat GETs reuse
+        # keep-alive connections instead of paying a fresh TCP+TLS
+        # handshake each time. Transient 429/5xx responses are retried
+        # with backoff on the same pooled connection; the Anthropic calls
+        # go through aiohttp and retry in _apost_claude.
+        self._session = requests.Session()
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504)
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=20, max_retries=retry)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+        self._session.headers['User-Agent'] = f'{self.email_from} CFO Monitor Script'
+
+    def close(self):
+        """Close the pooled HTTP session"""
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def search_sec_filings(self):
         """Search SEC EDGAR for 8-K filings mentioning CFO changes"""
         print("Searching SEC EDGAR filings...")
-        
-        headers = {
-            'User-Agent': f'{self.email_from} CFO Monitor Script'
-        }
-        
+
         base_url = "https://www.sec.gov/cgi-bin/browse-edgar"
         params = {
             'action': 'getcurrent',
@@ -46,21 +115,24 @@ class CFOMonitor:
         }
         
         try:
-            response = requests.get(base_url, params=params, headers=headers, timeout=30)
-            time.sleep(0.1)
-            
+            response = self._session.get(base_url, params=params, timeout=30, stream=True)
+
             if response.status_code == 200:
-                feed = feedparser.parse(response.content)
-                
+                # Hand the raw stream to feedparser so the feed is parsed as it
+                # arrives instead of being buffered whole and re-read
+                response.raw.decode_content = True
+                feed = feedparser.parse(response.raw)
+                response.close()
+
                 for entry in feed.entries:
                     title = entry.get('title', '')
                     summary = entry.get('summary', '')
                     link = entry.get('link', '')
-                    
-                    text = (title + ' ' + summary).lower()
-                    cfo_keywords = ['cfo', 'chief financial officer', 'financial officer']
-                    
-                    if any(keyword in text for keyword in cfo_keywords):
+
+                    if link in self._seen_urls:
+                        continue
+
+                    if _CFO_RE.search(title) or _CFO_RE.search(summary):
                         company_name = title.split('(')[0].strip() if '(' in title else title
                         
                         result = {
@@ -74,7 +146,8 @@ class CFOMonitor:
                         }
                         
                         self.results.append(result)
-                        
+                        self._seen_urls.add(link)
+
             print(f"Found {len([r for r in self.results if r['source'] == 'SEC EDGAR'])} SEC filings")
             
         except Exception as e:
@@ -95,41 +168,54 @@ class CFOMonitor:
             'appoints Chief Financial Officer'
         ]
         
-        for query in search_queries:
-            try:
-                url = f"https://news.google.com/rss/search?q={query.replace(' ', '+')}&hl=en-US&gl=US&ceid=US:en"
-                feed = feedparser.parse(url)
-                time.sleep(0.5)
-                
-                for entry in feed.entries[:5]:
-                    pub_date = entry.get('published_parsed')
-                    if pub_date:
-                        entry_date = datetime(*pub_date[:6])
-                        if datetime.now() - entry_date > timedelta(days=2):
+        # Feed fetches are IO-bound, so fan them out and collect as they finish
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = {executor.submit(self._fetch_news_query, query): query
+                       for query in search_queries}
+
+            for future in as_completed(futures):
+                query = futures[future]
+                try:
+                    for result in future.result():
+                        if result['url'] in self._seen_urls:
                             continue
-                    
-                    title = entry.get('title', '')
-                    link = entry.get('link', '')
-                    source = entry.get('source', {}).get('title', 'Unknown')
-                    
-                    if not any(r.get('url') == link for r in self.results):
-                        result = {
-                            'source': f'News: {source}',
-                            'company': self._extract_company(title),
-                            'title': title,
-                            'summary': '',
-                            'url': link,
-                            'date': entry.get('published', 'N/A'),
-                            'individual': self._extract_individual_name(title, '')
-                        }
-                        
                         self.results.append(result)
-                        
-            except Exception as e:
-                print(f"Error searching news for '{query}': {e}")
-        
+                        self._seen_urls.add(result['url'])
+                except Exception as e:
+                    print(f"Error searching news for '{query}': {e}")
+
         news_count = len([r for r in self.results if r['source'].startswith('News')])
         print(f"Found {news_count} news articles")
+
+    def _fetch_news_query(self, query):
+        """Fetch and filter one Google News query, returning result dicts"""
+        url = f"https://news.google.com/rss/search?q={query.replace(' ', '+')}&hl=en-US&gl=US&ceid=US:en"
+        feed = feedparser.parse(url)
+        cutoff = self._run_now - timedelta(days=2)
+
+        results = []
+        for entry in feed.entries[:5]:
+            pub_date = entry.get('published_parsed')
+            if pub_date:
+                entry_date = datetime(*pub_date[:6])
+                if entry_date < cutoff:
+                    continue
+
+            title = entry.get('title', '')
+            link = entry.get('link', '')
+            source = entry.get('source', {}).get('title', 'Unknown')
+
+            results.append({
+                'source': f'News: {source}',
+                'company': self._extract_company(title),
+                'title': title,
+                'summary': '',
+                'url': link,
+                'date': entry.get('published', 'N/A'),
+                'individual': self._extract_individual_name(title, '')
+            })
+
+        return results
     
     def _extract_company(self, title):
         """Extract company name from news title"""
@@ -144,30 +230,84 @@ class CFOMonitor:
     def _extract_individual_name(self, title, summary):
         """Extract individual's name from title or summary"""
         text = title + ' ' + summary
-        
-        # Common patterns for names in CFO announcements
-        patterns = [
-            r'(?:appoints|names|hires|welcomes)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)',
-            r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)\s+(?:as|named|appointed|joins)',
-            r'CFO\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text)
-            if match:
-                name = match.group(1).strip()
-                # Filter out common false positives
-                if len(name.split()) >= 2 and name not in ['Chief Financial', 'Financial Officer']:
-                    return name
-        
+
+        match = _NAME_RE.search(text)
+        if match:
+            name = next(g for g in match.groups() if g is not None).strip()
+            # Filter out common false positives
+            if len(name.split()) >= 2 and name not in ['Chief Financial', 'Financial Officer']:
+                return name
+
         return None
     
     def generate_tear_sheets(self):
-        """Tear sheet generation removed per user request"""
-        print("Tear sheet generation disabled")
-        return
-    
-    def _generate_company_tear_sheet(self, result):
+        """Generate company and individual tear sheets for all findings"""
+        if not self.anthropic_api_key:
+            print("No Anthropic API key - skipping tear sheets")
+            return
+
+        if not self.results:
+            return
+
+        print(f"\nGenerating tear sheets for {len(self.results)} findings...")
+        asyncio.run(self._agenerate_all())
+        print(f"Generated {len(self.tear_sheets)} tear sheets")
+
+    async def _agenerate_all(self):
+        """Run all tear sheet generations concurrently against the Claude API"""
+        # Cap in-flight requests to stay within Anthropic rate limits
+        semaphore = asyncio.Semaphore(5)
+
+        async with aiohttp.ClientSession() as session:
+            tasks = []
+            scheduled = set()
+            for result in self.results:
+                company_key = result['company'].strip().lower()
+                if ('company', company_key) not in scheduled:
+                    scheduled.add(('company', company_key))
+                    tasks.append(self._agenerate_one(session, semaphore, result, 'company'))
+
+                individual = result.get('individual')
+                if individual:
+                    individual_key = (individual.strip().lower(), company_key)
+                    if ('individual', individual_key) not in scheduled:
+                        scheduled.add(('individual', individual_key))
+                        tasks.append(self._agenerate_one(session, semaphore, result, 'individual'))
+
+            await asyncio.gather(*tasks)
+
+    async def _agenerate_one(self, session, semaphore, result, sheet_type):
+        """Generate a single tear sheet and record it with its filename"""
+        if sheet_type == 'company':
+            name = result['company']
+            prefix = 'Company'
+            cache = self._company_cache
+            key = name.strip().lower()
+        else:
+            name = result['individual']
+            prefix = 'Individual'
+            cache = self._individual_cache
+            key = (name.strip().lower(), result['company'].strip().lower())
+
+        content = cache.get(key)
+        if content is None:
+            async with semaphore:
+                if sheet_type == 'company':
+                    content = await self._generate_company_tear_sheet(session, result)
+                else:
+                    content = await self._generate_individual_tear_sheet(session, result)
+            if content:
+                cache[key] = content
+
+        if content:
+            self.tear_sheets.append({
+                'type': sheet_type,
+                'name': name,
+                'filename': f"{prefix}_Tear_Sheet_{self._sanitize_filename(name)}.docx",
+                'document': content
+            })
+
+    async def _generate_company_tear_sheet(self, session, result):
         """Generate company tear sheet using Claude API"""
         try:
             # Search for company information
@@ -178,7 +318,7 @@ class CFOMonitor:
 Use this structure:
 
 **COMPANY TEAR SHEET: {company_name}**
-Generated: {datetime.now().strftime("%B %d, %Y")}
+Generated: {self._run_date_str}
 
 **Section 1: Company Overview**
 - Generate background bullets about the company with focus on industry/sector, sources of income, headquarters, founding year, employees, and relevant background
@@ -202,33 +342,18 @@ Generated: {datetime.now().strftime("%B %d, %Y")}
 
 Provide comprehensive, well-researched information in plain text format with simple formatting."""
 
-            response = requests.post(
-                "https://api.anthropic.com/v1/messages",
-                headers={
-                    "Content-Type": "application/json",
-                    "x-api-key": self.anthropic_api_key,
-                    "anthropic-version": "2023-06-01"
-                },
-                json={
-                    "model": "claude-sonnet-4-20250514",
-                    "max_tokens": 4000,
-                    "messages": [{"role": "user", "content": prompt}]
-                },
-                timeout=60
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                content = data.get('content', [])
-                if content and content[0].get('type') == 'text':
-                    return content[0].get('text', '')
-            
+            return await self._apost_claude(session, {
+                "model": _COMPANY_MODEL,
+                "max_tokens": _COMPANY_MAX_TOKENS,
+                "messages": [{"role": "user", "content": prompt}]
+            })
+
         except Exception as e:
             print(f"Error generating company tear sheet: {e}")
-        
+
         return None
-    
-    def _generate_individual_tear_sheet(self, result):
+
+    async def _generate_individual_tear_sheet(self, session, result):
         """Generate individual tear sheet using Claude API"""
         try:
             individual_name = result.get('individual')
@@ -239,7 +364,7 @@ Provide comprehensive, well-researched information in plain text format with sim
 Use this structure:
 
 **INDIVIDUAL TEAR SHEET: {individual_name}**
-Generated: {datetime.now().strftime("%B %d, %Y")}
+Generated: {self._run_date_str}
 
 **Section 1: Executive Overview**
 - Full name
@@ -280,93 +405,105 @@ Grouped by year:
 
 Provide comprehensive, well-researched information in plain text format."""
 
-            response = requests.post(
+            return await self._apost_claude(session, {
+                "model": _INDIVIDUAL_MODEL,
+                "max_tokens": _INDIVIDUAL_MAX_TOKENS,
+                "messages": [{"role": "user", "content": prompt}]
+            })
+
+        except Exception as e:
+            print(f"Error generating individual tear sheet: {e}")
+
+        return None
+
+    async def _apost_claude(self, session, payload):
+        """POST to the Claude API, retrying transient failures with backoff
+
+        Mirrors the Session retry policy on the requests side: up to three
+        retries on 429/5xx, sleeping 0.5s/1s/2s between attempts.
+        """
+        for attempt in range(4):
+            if attempt:
+                await asyncio.sleep(0.5 * 2 ** (attempt - 1))
+
+            async with session.post(
                 "https://api.anthropic.com/v1/messages",
                 headers={
                     "Content-Type": "application/json",
                     "x-api-key": self.anthropic_api_key,
                     "anthropic-version": "2023-06-01"
                 },
-                json={
-                    "model": "claude-sonnet-4-20250514",
-                    "max_tokens": 4000,
-                    "messages": [{"role": "user", "content": prompt}]
-                },
-                timeout=60
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                content = data.get('content', [])
-                if content and content[0].get('type') == 'text':
-                    return content[0].get('text', '')
-            
-        except Exception as e:
-            print(f"Error generating individual tear sheet: {e}")
-        
+                json=payload,
+                timeout=aiohttp.ClientTimeout(total=60)
+            ) as response:
+                if response.status in (429, 500, 502, 503, 504):
+                    continue
+                if response.status == 200:
+                    data = await response.json()
+                    content = data.get('content', [])
+                    if content and content[0].get('type') == 'text':
+                        return content[0].get('text', '')
+                return None
+
         return None
     
     def _sanitize_filename(self, name):
         """Sanitize filename by removing invalid characters"""
-        return re.sub(r'[^\w\s-]', '', name).strip().replace(' ', '_')[:50]
+        return _SANITIZE_RE.sub('', name).strip().replace(' ', '_')[:50]
     
     def _create_word_document(self, content):
-        """Create a simple Word document from text content"""
-        # Using python-docx library to create proper Word documents
-        try:
-            from docx import Document
-            from docx.shared import Pt, Inches
-            from docx.enum.text import WD_ALIGN_PARAGRAPH
-            
-            doc = Document()
-            
-            # Set narrow margins
-            sections = doc.sections
-            for section in sections:
-                section.top_margin = Inches(0.5)
-                section.bottom_margin = Inches(0.5)
-                section.left_margin = Inches(0.75)
-                section.right_margin = Inches(0.75)
-            
-            # Parse and add content
-            for line in content.split('\n'):
-                line = line.strip()
-                if not line:
-                    continue
-                
-                # Headers (lines starting with **)
-                if line.startswith('**') and line.endswith('**'):
-                    text = line.strip('*').strip()
-                    para = doc.add_paragraph(text)
-                    para.style = 'Heading 1'
-                    run = para.runs[0]
-                    run.font.size = Pt(14)
-                    run.bold = True
-                
-                # Bullet points
-                elif line.startswith('-') or line.startswith('•'):
-                    text = line.lstrip('-•').strip()
-                    para = doc.add_paragraph(text, style='List Bullet')
-                    run = para.runs[0]
-                    run.font.size = Pt(11)
-                
-                # Regular paragraphs
-                else:
-                    para = doc.add_paragraph(line)
-                    run = para.runs[0]
-                    run.font.size = Pt(11)
-            
-            # Save to BytesIO
-            docx_file = BytesIO()
-            doc.save(docx_file)
-            docx_file.seek(0)
-            return docx_file
-            
-        except ImportError:
+        """Create a simple Word document from text content, returned as bytes"""
+        if _DOCX is None:
             print("Warning: python-docx not installed. Creating text file instead.")
             # Fallback to text file
-            text_file = BytesIO(content.encode('utf-8'))
-            return text_file
+            return content.encode('utf-8')
+
+        Document, Pt, Inches, _ = _DOCX
+
+        doc = Document()
+
+        # Set narrow margins
+        sections = doc.sections
+        for section in sections:
+            section.top_margin = Inches(0.5)
+            section.bottom_margin = Inches(0.5)
+            section.left_margin = Inches(0.75)
+            section.right_margin = Inches(0.75)
+
+        # Parse and add content in a single pass; classify each line by its
+        # edge characters via slicing rather than repeated method calls
+        for line in content.splitlines():
+            line = line.strip()
+            if not line:
+                continue
+
+            # Headers (lines wrapped in **)
+            if line[:2] == '**' and line[-2:] == '**':
+                text = line.strip('*').strip()
+                para = doc.add_paragraph(text)
+                para.style = 'Heading 1'
+                run = para.runs[0]
+                run.font.size = Pt(14)
+                run.bold = True
+
+            # Bullet points
+            elif line[0] in '-•':
+                text = line.lstrip('-•').strip()
+                para = doc.add_paragraph(text, style='List Bullet')
+                run = para.runs[0]
+                run.font.size = Pt(11)
+
+            # Regular paragraphs
+            else:
+                para = doc.add_paragraph(line)
+                run = para.runs[0]
+                run.font.size = Pt(11)
+
+        # Save to BytesIO; getvalue() hands back the bytes without a
+        # seek/read copy
+        docx_file = BytesIO()
+        doc.save(docx_file)
+        return docx_file.getvalue()
     
     def send_email(self):
         """Send email digest with all findings (or no-changes notification)"""
@@ -374,19 +511,38 @@ Provide comprehensive, well-researched information in plain text format."""
         
         # Create email message
         if self.results:
-            subject = f'CFO Changes Alert - {datetime.now().strftime("%B %d, %Y")} ({len(self.results)} findings)'
+            subject = f'CFO Changes Alert - {self._run_date_str} ({len(self.results)} findings)'
         else:
-            subject = f'CFO Changes Alert - {datetime.now().strftime("%B %d, %Y")} (No changes)'
+            subject = f'CFO Changes Alert - {self._run_date_str} (No changes)'
         
-        msg = MIMEMultipart()
+        msg = EmailMessage()
         msg['Subject'] = subject
         msg['From'] = self.email_from
         msg['To'] = self.email_to
-        
+
         # Create email body
         body = self._create_email_body()
-        msg.attach(MIMEText(body, 'html'))
-        
+        msg.set_content(body, subtype='html')
+
+        # Build the .docx files in parallel (zip compression releases the
+        # GIL), then attach them on the main thread
+        if self.tear_sheets:
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                futures = [(tear_sheet, executor.submit(self._create_word_document, tear_sheet['document']))
+                           for tear_sheet in self.tear_sheets]
+
+                for tear_sheet, future in futures:
+                    try:
+                        docx_bytes = future.result()
+                        msg.add_attachment(
+                            docx_bytes,
+                            maintype='application',
+                            subtype='vnd.openxmlformats-officedocument.wordprocessingml.document',
+                            filename=tear_sheet['filename']
+                        )
+                    except Exception as e:
+                        print(f"Error attaching {tear_sheet['filename']}: {e}")
+
         try:
             with smtplib.SMTP_SSL('smtp.gmail.com', 465) as server:
                 server.login(self.email_from, self.email_password)
@@ -413,7 +569,7 @@ Provide comprehensive, well-researched information in plain text format."""
             </head>
             <body>
                 <div class="summary">
-                    <h2>CFO Changes Summary - {datetime.now().strftime("%B %d, %Y")}</h2>
+                    <h2>CFO Changes Summary - {self._run_date_str}</h2>
                     <p>Our automated monitoring system found <span class="highlight">no CFO-related changes</span> in the past 24 hours. We searched both SEC EDGAR filings and major business news sources.</p>
                     <p>No CFO movement today.</p>
                 </div>
@@ -421,26 +577,36 @@ Provide comprehensive, well-researched information in plain text format."""
             </html>
             """
         
-        num_companies = len(set(r['company'] for r in self.results))
-        
-        # Determine most relevant finding (prioritize SEC filings, then news)
+        # Single pass: collect companies and the most relevant finding
+        # (prioritize SEC filings, then news)
+        companies = set()
         most_relevant = None
         for result in self.results:
-            if result['source'] == 'SEC EDGAR':
+            companies.add(result['company'])
+            if most_relevant is None and result['source'] == 'SEC EDGAR':
                 most_relevant = result
-                break
+
+        num_companies = len(companies)
         if not most_relevant and self.results:
             most_relevant = self.results[0]
         
         # Create highlight blurb for most relevant change
         highlight_blurb = ""
         if most_relevant:
-            individual = most_relevant.get('individual', 'a new CFO')
+            individual = most_relevant.get('individual') or 'a new CFO'
             company = most_relevant['company']
             status = self._determine_cfo_status(most_relevant['title'])
             highlight_blurb = f" Most notably, {company} has {status} {individual}."
-        
-        summary = f"""
+
+        # Render all <li> rows in one join rather than per-result concatenation
+        rows = "\n".join(
+            f"<li>• <strong>{r['company']}</strong> - {r['company']} has "
+            f"{self._determine_cfo_status(r['title'])} {r.get('individual') or 'an executive'}. "
+            f"<a href='{r['url']}'>Source</a></li>"
+            for r in self.results
+        )
+
+        return f"""
         <html>
         <head>
             <style>
@@ -453,29 +619,17 @@ Provide comprehensive, well-researched information in plain text format."""
         </head>
         <body>
             <div class="summary">
-                <h2>CFO Changes Summary - {datetime.now().strftime("%B %d, %Y")}</h2>
+                <h2>CFO Changes Summary - {self._run_date_str}</h2>
                 <p>Our automated monitoring system has identified <span class="highlight">{len(self.results)} CFO-related change{"s" if len(self.results) != 1 else ""}</span> across <span class="highlight">{num_companies} compan{"ies" if num_companies != 1 else "y"}</span> in the past 24 hours.{highlight_blurb}</p>
                 
                 <h3>Identified CFO Changes:</h3>
                 <ul>
-        """
-        
-        for result in self.results:
-            company = result['company']
-            individual = result.get('individual', 'an executive')
-            status = self._determine_cfo_status(result['title'])
-            url = result['url']
-            
-            summary += f"<li>• <strong>{company}</strong> - {company} has {status} {individual}. <a href='{url}'>Source</a></li>"
-        
-        summary += """
+        {rows}
                 </ul>
             </div>
         </body>
         </html>
         """
-        
-        return summary
     
     def _determine_cfo_status(self, title):
         """Determine if CFO was hired, fired, or made interim based on title text"""
@@ -498,6 +652,7 @@ Provide comprehensive, well-researched information in plain text format."""
         
         self.search_sec_filings()
         self.search_news()
+        self.generate_tear_sheets()
         self.send_email()
         
         print("=" * 70)